@@ -1,4 +1,10 @@
-from .agent import root_agent, grading_app
+from .agent import get_app, get_root_agent
 
-# Expose `app` for ADK when loading this package as an App
-app = grading_app
+
+def __getattr__(name: str):
+    """Expose `root_agent` and `app` for ADK without building them at import."""
+    if name == "root_agent":
+        return get_root_agent()
+    if name in ("app", "grading_app"):
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
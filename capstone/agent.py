@@ -5,79 +5,260 @@ This is a multi-agent system for academic grading using Google ADK.
 Architecture: Root Agent -> Rubric Validator -> Grading Pipeline -> Feedback
 """
 
-import os
+import asyncio
+import functools
+import logging
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Tuple
 
+from google.adk.agents import BaseAgent
 from google.adk.apps.app import App, EventsCompactionConfig
 from google.adk.plugins import LoggingPlugin
 from google.adk.runners import Runner
-from google.adk.sessions.database_session_service import DatabaseSessionService
+from google.adk.sessions import BaseSessionService, InMemorySessionService, Session
+from google.genai import types
 
 # Import configuration
-from .config import APP_NAME, USER_ID, DATA_DIR
+from .config import APP_NAME, USER_ID, DATABASE_URL
 
-# Import agents
-from .agents import root_agent, build_graders_from_rubric
+# Import utilities
+from .utils import json_utils
 
 # Import plugins
 from .plugins import RubricGuardrailPlugin
 
-print("✅ Smart Grading Assistant - Loading...")
+logger = logging.getLogger(__name__)
+
+# Agents, the App, the session service and the Runner are built lazily on
+# first use, so importing this module (e.g. for grade_submission) stays cheap.
 
 # =============================================================================
 # APP CONFIGURATION
 # =============================================================================
 
-grading_app = App(
-    name=APP_NAME,
-    root_agent=root_agent,
-    plugins=[
-        LoggingPlugin(),
-        RubricGuardrailPlugin(build_graders_fn=build_graders_from_rubric),
-    ],
-    events_compaction_config=EventsCompactionConfig(
-        compaction_interval=6,  # summarize history every 6 invocations
-        overlap_size=2,         # keep last 2 turns verbatim for continuity
-    ),
-)
-
-print("✅ App configured with context compaction (Resumability disabled)")
+
+@functools.cache
+def get_root_agent() -> BaseAgent:
+    """Return the root agent, building the agent graph on first call."""
+    from .agents import root_agent
+
+    return root_agent
+
+
+@functools.cache
+def get_app() -> App:
+    """Return the grading App (root agent + plugins + context compaction)."""
+    logger.debug("Smart Grading Assistant - Loading...")
+    grading_app = App(
+        name=APP_NAME,
+        root_agent=get_root_agent(),
+        plugins=[
+            LoggingPlugin(),
+            RubricGuardrailPlugin(),
+        ],
+        events_compaction_config=EventsCompactionConfig(
+            compaction_interval=6,  # summarize history every 6 invocations
+            overlap_size=2,         # keep last 2 turns verbatim for continuity
+        ),
+    )
+    logger.debug("App configured with context compaction (Resumability disabled)")
+    return grading_app
+
 
 # =============================================================================
 # SESSION & RUNNER SETUP
 # =============================================================================
 
-# Use SQLite for persistent sessions
-db_path = os.path.join(DATA_DIR, "grading_sessions.db")
-db_url = f"sqlite:///{db_path}"
-session_service = DatabaseSessionService(db_url=db_url)
 
-# Create runner with DatabaseSessionService
-runner = Runner(
-    app=grading_app,
-    session_service=session_service,
-)
+@functools.cache
+def get_session_service() -> BaseSessionService:
+    """Return the database session service used for persistent gradings.
+
+    Sessions live in the database (SQLite in WAL mode by default) and can be
+    resumed later.
+    """
+    from .services import create_session_service
+
+    session_service = create_session_service(DATABASE_URL)
+    logger.debug(
+        "Session service configured with DatabaseSessionService (database: %s)",
+        session_service.db_engine.url.render_as_string(hide_password=True),
+    )
+    return session_service
+
+
+@functools.cache
+def get_transient_session_service() -> BaseSessionService:
+    """Return the in-memory session service used for one-shot gradings."""
+    return InMemorySessionService()
+
+
+@functools.cache
+def get_runner() -> Runner:
+    """Return the Runner bound to the grading App and the database sessions."""
+    return Runner(app=get_app(), session_service=get_session_service())
+
+
+@functools.cache
+def get_transient_runner() -> Runner:
+    """Return the Runner bound to the grading App and the in-memory sessions."""
+    return Runner(app=get_app(), session_service=get_transient_session_service())
+
+
+def __getattr__(name: str):
+    """Resolve legacy module attributes (root_agent, grading_app, ...) lazily."""
+    factories = {
+        "root_agent": get_root_agent,
+        "grading_app": get_app,
+        "session_service": get_session_service,
+        "runner": get_runner,
+    }
+    if name in factories:
+        return factories[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# =============================================================================
+# GRADING HELPERS
+# =============================================================================
+
+
+def _build_grading_message(submission: str, rubric: dict) -> types.Content:
+    """Build the user message carrying both the rubric and the submission.
+
+    The rubric is sent as compact JSON: the root agent passes it verbatim to
+    validate_rubric, and dropping indentation removes whitespace tokens from
+    every prefill that carries this message.
+    """
+    text = (
+        "Please grade this submission.\n\n"
+        f"RUBRIC (JSON):\n{json_utils.dumps(rubric)}\n\n"
+        f"STUDENT SUBMISSION:\n{submission}"
+    )
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+async def _get_or_create_session(
+    session_service: BaseSessionService, session_id: Optional[str]
+) -> Session:
+    """Return the session with the given id, creating it when missing.
+
+    A new session is created directly when no id is given. Only a missing
+    session triggers creation; other errors, including cancellation,
+    propagate to the caller.
+    """
+    if session_id is not None:
+        session = await session_service.get_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        )
+        if session is not None:
+            return session
+    return await session_service.create_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+    )
+
+
+async def stream_submission(
+    submission: str,
+    rubric: dict,
+    session_id: Optional[str] = None,
+    persistent: bool = True,
+) -> AsyncIterator[Tuple[str, str]]:
+    """Run the grading workflow and yield (author, text) pairs as events arrive.
+
+    Args:
+        submission: Student submission text/code.
+        rubric: Rubric dict (same structure accepted by validate_rubric).
+        session_id: Optional session id; an existing session is reused,
+            otherwise a new one is created (with a generated id if omitted).
+        persistent: Store the session in the database so it can be resumed.
+            Pass False for one-shot gradings: the session is kept in memory
+            and deleted once the grading finishes.
+
+    Yields:
+        Tuples of (event author, text part) in the order they are produced.
+    """
+    if persistent:
+        session_service, runner = get_session_service(), get_runner()
+    else:
+        session_service, runner = get_transient_session_service(), get_transient_runner()
+
+    session = await _get_or_create_session(session_service, session_id)
+
+    try:
+        async for event in runner.run_async(
+            user_id=USER_ID,
+            session_id=session.id,
+            new_message=_build_grading_message(submission, rubric),
+        ):
+            if not (event.content and event.content.parts):
+                continue
+            for part in event.content.parts:
+                if part.text:
+                    yield event.author, part.text
+    finally:
+        # Transient sessions hold the submission and every event; drop them
+        # once the grading ends so batches don't accumulate them in memory.
+        if not persistent:
+            await session_service.delete_session(
+                app_name=APP_NAME, user_id=USER_ID, session_id=session.id
+            )
+
+
+async def grade_submission(
+    submission: str,
+    rubric: dict,
+    session_id: Optional[str] = None,
+    persistent: bool = True,
+) -> dict:
+    """Grade a submission and collect every text response into a list.
+
+    Prefer stream_submission when the output can be consumed incrementally.
+    """
+    results = [
+        text
+        async for _, text in stream_submission(
+            submission, rubric, session_id=session_id, persistent=persistent
+        )
+    ]
+    return {"results": results}
+
+
+async def grade_batch(
+    submissions: List[str],
+    rubric: dict,
+    max_concurrency: int = 16,
+    persistent: bool = True,
+) -> List[dict]:
+    """Grade many submissions concurrently against the same rubric.
+
+    At most max_concurrency gradings run at once, which keeps bursts below
+    Gemini rate limits. Results are returned in the order of submissions.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _grade_one(submission: str) -> dict:
+        async with semaphore:
+            return await grade_submission(submission, rubric, persistent=persistent)
+
+    return await asyncio.gather(*(_grade_one(s) for s in submissions))
 
-print(f"✅ Runner configured with DatabaseSessionService")
-print(f"   Database: {db_path}")
 
 # =============================================================================
 # DEMO FUNCTION (for testing)
 # =============================================================================
 
 
-def demo():
+async def demo():
     """Run a demo grading session."""
-    import json
-    from pathlib import Path
-
     print("\n" + "=" * 80)
     print("DEMO: Smart Grading Assistant")
     print("=" * 80 + "\n")
 
     # Load example rubric
     rubric_path = Path(__file__).parent / "examples" / "rubrics" / "python_code_rubric.json"
-    with open(rubric_path) as f:
-        rubric = json.load(f)
+    with open(rubric_path, "rb") as f:
+        rubric = json_utils.loads(f.read())
 
     # Load example submission
     submission_path = Path(__file__).parent / "examples" / "submissions" / "sample_code.py"
@@ -88,26 +269,10 @@ def demo():
     print("📄 Submission loaded: sample_code.py")
     print("\nStarting grading session...\n")
 
-    # Run the grading workflow
-    session = runner.create_session(user_id=USER_ID)
-
-    # Step 1: Validate rubric
-    print("Step 1: Validating rubric...")
-    result1 = runner.run(
-        session_id=session.id,
-        user_id=USER_ID,
-        user_message=json.dumps(rubric, indent=2),
-    )
-    print(f"Response: {result1.content}\n")
-
-    # Step 2: Submit student work
-    print("Step 2: Submitting student work...")
-    result2 = runner.run(
-        session_id=session.id,
-        user_id=USER_ID,
-        user_message=submission,
-    )
-    print(f"Response: {result2.content}\n")
+    # Print responses as they arrive instead of waiting for the whole pipeline
+    async for _, text in stream_submission(submission, rubric):
+        print(text, end="", flush=True)
+    print()
 
     print("=" * 80)
     print("Demo completed!")
@@ -122,7 +287,7 @@ if __name__ == "__main__":
     import sys
 
     if len(sys.argv) > 1 and sys.argv[1] == "demo":
-        demo()
+        asyncio.run(demo())
     else:
         print("\n" + "=" * 80)
         print("Smart Grading Assistant - Ready")
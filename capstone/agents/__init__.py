@@ -2,24 +2,19 @@
 
 from .rubric_validator import rubric_validator_agent
 from .graders import (
-    create_criterion_grader,
-    build_graders_from_rubric,
-    parallel_graders,
-    DEFAULT_GRADE_OUTPUT_KEYS,
+    build_multi_criterion_instruction,
+    multi_criterion_grader,
 )
 from .aggregator import aggregator_agent
-from .approval import approval_agent, finalize_grade, needs_approval
+from .approval import finalize_grade, needs_approval
 from .feedback import feedback_agent
 from .root import root_agent, grading_pipeline
 
 __all__ = [
     "rubric_validator_agent",
-    "create_criterion_grader",
-    "build_graders_from_rubric",
-    "parallel_graders",
-    "DEFAULT_GRADE_OUTPUT_KEYS",
+    "build_multi_criterion_instruction",
+    "multi_criterion_grader",
     "aggregator_agent",
-    "approval_agent",
     "finalize_grade",
     "needs_approval",
     "feedback_agent",
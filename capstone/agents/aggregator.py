@@ -1,33 +1,71 @@
-"""Aggregator Agent - combines criterion grades into final score."""
+"""Aggregator Agent - combines criterion grades into final score and finalizes it."""
+
+import logging
+from typing import Optional
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.tools import FunctionTool
+from google.genai import types
+
+from ..services import get_model
+from ..utils.scoring import collect_grades, compute_final_score
+from .approval import finalize_grade, needs_approval
+
+logger = logging.getLogger(__name__)
+
+
+def aggregate_grades(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Compute and finalize the grade in Python, skipping the LLM when possible.
 
-from ..config import MODEL_LITE, retry_config
-from ..tools.build_grades_payload import build_grades_payload
-from ..tools.calculate_score import calculate_final_score
+    Aggregation is deterministic, so the grades saved by MultiCriterionGrader
+    are reconciled with the rubric, scored directly and stored under
+    aggregation_result. Grades that don't match the rubric stop here with an
+    error and are never finalized. Grades that need no human approval are
+    finalized here as well. Only edge cases fall through to the LLM, which
+    calls finalize_grade behind a confirmation.
+    """
+    state = callback_context.state
+    collected = collect_grades(state)
+    if collected["status"] != "ok":
+        state["aggregation_result"] = collected
+        return types.Content(role="model", parts=[types.Part(text=collected["error_message"])])
+
+    result = compute_final_score(collected["grades"])
+    state["aggregation_result"] = result
+    if result["status"] != "success":
+        return types.Content(role="model", parts=[types.Part(text=result["error_message"])])
+    if result["requires_human_approval"]:
+        return None
+
+    approval = finalize_grade(
+        final_score=result["total_score"],
+        max_score=result["max_possible"],
+        percentage=result["percentage"],
+        letter_grade=result["letter_grade"],
+        reason=result["message"],
+    )
+    state["approval_result"] = approval
+    return types.Content(role="model", parts=[types.Part(text=approval["message"])])
 
 
 aggregator_agent = LlmAgent(
     name="AggregatorAgent",
-    model=Gemini(model=MODEL_LITE, retry_options=retry_config),
-    description="Aggregates individual criterion grades into a final score",
-    instruction="""You are a grade aggregator. You MUST complete these steps IN ORDER:
-    
-    STEP 1: Call build_grades_payload tool (no parameters needed).
-            This returns a JSON payload with all criterion grades.
-    
-    STEP 2: Call calculate_final_score tool using the grades_json value from Step 1.
-            This computes the final score, percentage, letter grade, and approval status.
-    
-    STEP 3: After BOTH tools are called, briefly summarize:
-            - Final score and letter grade
-            - Whether human approval is required
-    
-    DO NOT skip Step 2. You MUST call both tools in sequence.
-    The workflow is incomplete if you only call build_grades_payload.""",
-    tools=[build_grades_payload, calculate_final_score],
-    output_key="aggregation_result",
+    model=get_model(),
+    description="Aggregates criterion grades into a final score and finalizes it",
+    instruction="""You finalize grades that need human approval.
+
+    Aggregation result: {aggregation_result}
+
+    Call finalize_grade ONCE with the values from the aggregation result
+    (total_score as final_score, max_possible as max_score, percentage,
+    letter_grade, and approval_reason as reason).
+
+    The system will automatically request human confirmation.
+    After calling finalize_grade, do NOT generate additional text.""",
+    tools=[FunctionTool(finalize_grade, require_confirmation=needs_approval)],
+    before_agent_callback=aggregate_grades,
+    output_key="approval_result",
 )
 
-print("✅ AggregatorAgent created")
+logger.debug("AggregatorAgent created")
@@ -1,14 +1,17 @@
 """Feedback Generator Agent - creates constructive feedback for students."""
 
+import logging
+
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 
-from ..config import MODEL_LITE, retry_config
+from ..services import get_model
+
+logger = logging.getLogger(__name__)
 
 
 feedback_agent = LlmAgent(
     name="FeedbackGeneratorAgent",
-    model=Gemini(model=MODEL_LITE, retry_options=retry_config),
+    model=get_model(),
     description="Generates comprehensive feedback for the student",
     instruction="""You are a feedback specialist. Your job is to create 
     constructive, encouraging feedback for the student.
@@ -29,4 +32,4 @@ feedback_agent = LlmAgent(
     output_key="final_feedback",
 )
 
-print("✅ FeedbackGeneratorAgent created")
+logger.debug("FeedbackGeneratorAgent created")
@@ -1,101 +1,55 @@
 """Grader agents for evaluating submissions against rubric criteria."""
 
 import logging
-from typing import List, Tuple
 
-from google.adk.agents import LlmAgent, ParallelAgent
-from google.adk.models.google_llm import Gemini
+from google.adk.agents import LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
 
-from ..config import MODEL_LITE, retry_config
-from ..tools.grade_criterion import grade_criterion
-from ..utils.text_utils import slugify
+from ..schemas import RubricGrades
+from ..services import get_model
 
+logger = logging.getLogger(__name__)
 
-def create_criterion_grader(criterion_name: str, criterion_description: str, max_score: int) -> LlmAgent:
-    """Factory function to create a grader agent for a specific criterion.
-    
-    This allows us to create graders dynamically based on the rubric.
-    """
-    criterion_slug = slugify(criterion_name)
-    return LlmAgent(
-        name=f"Grader_{criterion_slug}",
-        model=Gemini(model=MODEL_LITE, retry_options=retry_config),
-        description=f"Evaluates submissions for: {criterion_name}",
-        instruction=f"""You are an expert evaluator for the criterion: "{criterion_name}"
-        
-        Criterion Description: {criterion_description}
-        Maximum Score: {max_score} points
-        
-        IMPORTANT: The student submission is available in the conversation history (it was saved earlier).
-        Look for the code/text that was submitted by the student.
-        
-        Your task:
-        1. Find and read the student's submission from the conversation
-        2. Evaluate it against this specific criterion: {criterion_name}
-        3. Determine a score from 0 to {max_score}
-        4. Call the grade_criterion tool ONCE with:
-           - criterion_name: "{criterion_name}"
-           - criterion_description: "{criterion_description}"
-           - max_score: {max_score}
-           - score: your determined score
-           - submission_content: the student's submission text
-           - evaluation_notes: your detailed evaluation
-        5. After calling the tool, do NOT generate any additional text
-        
-        Be fair, consistent, and constructive in your evaluation notes.
-        Focus ONLY on this criterion.""",
-        tools=[grade_criterion],
-        output_key=f"grade_{criterion_slug}",
+
+def build_multi_criterion_instruction(rubric: dict) -> str:
+    """Build a single grading prompt that enumerates every rubric criterion."""
+    criteria = rubric.get("criteria") or []
+    criteria_lines = "\n".join(
+        f"- {c.get('name', 'Unnamed Criterion')} (max {c.get('max_score', 0)} points): "
+        f"{c.get('description', 'No description provided')}"
+        for c in criteria
     )
+    return f"""You are an expert evaluator grading a student submission against a rubric.
 
+    IMPORTANT: The student submission is available in the conversation history (it was saved earlier).
+    Look for the code/text that was submitted by the student.
 
-def build_graders_from_rubric(rubric: dict) -> Tuple[List[LlmAgent], List[str]]:
-    """Build grader agents and their output keys from rubric criteria."""
-    graders: List[LlmAgent] = []
-    grade_keys: List[str] = []
-    criteria = rubric.get("criteria") or []
-    for criterion in criteria:
-        name = criterion.get("name") or "Unnamed Criterion"
-        desc = criterion.get("description") or "No description provided"
-        max_score = criterion.get("max_score") or 0
-        slug = criterion.get("slug") or slugify(name)
-        try:
-            graders.append(create_criterion_grader(name, desc, max_score))
-            grade_keys.append(f"grade_{slug}")
-        except Exception as exc:
-            logging.warning("Failed to create grader for criterion '%s': %s", name, exc)
-    return graders, grade_keys
+    Score EACH of the following {len(criteria)} criteria:
+{criteria_lines}
 
+    For every criterion, return one grade with:
+    - criterion: the exact criterion name as written above
+    - score: a number from 0 to the criterion's max points
+    - justification: your detailed evaluation notes for that criterion
 
-# Default graders for Python code rubric (will be replaced dynamically when rubric is provided)
-code_quality_grader = create_criterion_grader(
-    "Code Quality", 
-    "Evaluate code readability, naming conventions, and PEP 8 adherence",
-    30
-)
+    Evaluate each criterion independently. Be fair, consistent, and constructive."""
 
-functionality_grader = create_criterion_grader(
-    "Functionality",
-    "Evaluate if the code correctly solves the problem",
-    40
-)
 
-documentation_grader = create_criterion_grader(
-    "Documentation",
-    "Evaluate docstrings, comments, and code explanation",
-    30
-)
+def multi_criterion_instruction(context: ReadonlyContext) -> str:
+    """Instruction provider that reads the validated rubric from session state."""
+    rubric = context.state.get("rubric") or {}
+    return build_multi_criterion_instruction(rubric)
 
-DEFAULT_GRADE_OUTPUT_KEYS = [
-    code_quality_grader.output_key,
-    functionality_grader.output_key,
-    documentation_grader.output_key,
-]
 
-# Grading agent group (parallel execution for efficiency)
-parallel_graders = ParallelAgent(
-    name="ParallelGraders",  # Name expected by guardrail
-    sub_agents=[code_quality_grader, functionality_grader, documentation_grader],
+# Single grader for all criteria: one prompt prefill and one round-trip
+# instead of one LLM call per criterion.
+multi_criterion_grader = LlmAgent(
+    name="MultiCriterionGrader",
+    model=get_model(),
+    description="Evaluates the submission against every rubric criterion in one call",
+    instruction=multi_criterion_instruction,
+    output_schema=RubricGrades,
+    output_key="all_grades",
 )
 
-print("✅ Graders module loaded (3 default criterion graders, parallel mode)")
+logger.debug("Graders module loaded (single multi-criterion grader)")
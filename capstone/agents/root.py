@@ -1,38 +1,39 @@
 """Root Agent - orchestrates the entire grading workflow."""
 
+import logging
+
 from google.adk.agents import LlmAgent, SequentialAgent
-from google.adk.models.google_llm import Gemini
 from google.adk.tools import FunctionTool
 
-from ..config import MODEL_LITE, retry_config
+from ..services import get_model
 from ..tools.save_submission import save_submission
 from ..tools.validate_rubric import validate_rubric
-from .graders import parallel_graders
+from .graders import multi_criterion_grader
 from .aggregator import aggregator_agent
-from .approval import approval_agent
 from .feedback import feedback_agent
 
+logger = logging.getLogger(__name__)
+
 
 # Grading Pipeline: combines all grading steps
 grading_pipeline = SequentialAgent(
     name="GradingPipeline",
-    description="Executes the complete grading workflow: evaluates each criterion, aggregates scores, handles approval, and generates feedback.",
+    description="Executes the complete grading workflow: evaluates each criterion, aggregates and finalizes the score (with approval for edge cases), and generates feedback.",
     sub_agents=[
-        parallel_graders,
+        multi_criterion_grader,
         aggregator_agent,
-        approval_agent,
         feedback_agent,
     ],
 )
 
-print("✅ GradingPipeline created")
+logger.debug("GradingPipeline created")
 
 # Root Agent: hybrid design
 # - validate_rubric and save_submission are direct tools (root controls)
 # - GradingPipeline is a sub-agent (transfer_to_agent for real execution)
 root_agent = LlmAgent(
     name="SmartGradingAssistant",
-    model=Gemini(model=MODEL_LITE, retry_options=retry_config),
+    model=get_model(),
     description="Main coordinator for the Smart Grading Assistant",
     instruction="""You are the Smart Grading Assistant. You control rubric validation and submission storage directly, then delegate grading to a specialized pipeline.
 
@@ -63,6 +64,5 @@ root_agent = LlmAgent(
     sub_agents=[grading_pipeline],
 )
 
-print("✅ Root Agent (SmartGradingAssistant) created")
-print("   Design: Hybrid - tools for validation/submission, sub-agent for grading pipeline")
+logger.debug("Root Agent (SmartGradingAssistant) created with tools for validation/submission and a grading pipeline sub-agent")
 
@@ -1,15 +1,18 @@
 """Rubric Validator Agent - validates rubric structure before grading."""
 
+import logging
+
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 
-from ..config import MODEL_LITE, retry_config
+from ..services import get_model
 from ..tools.validate_rubric import validate_rubric
 
+logger = logging.getLogger(__name__)
+
 
 rubric_validator_agent = LlmAgent(
     name="RubricValidatorAgent",
-    model=Gemini(model=MODEL_LITE, retry_options=retry_config),
+    model=get_model(),
     description="Validates the structure and completeness of grading rubrics",
     instruction="""You are a rubric validation specialist. Your job is to validate 
     grading rubrics before they are used for evaluation.
@@ -29,4 +32,4 @@ rubric_validator_agent = LlmAgent(
     output_key="validation_result",
 )
 
-print("✅ RubricValidatorAgent created")
+logger.debug("RubricValidatorAgent created")
@@ -6,6 +6,7 @@ from .settings import (
     BASE_DIR,
     LOG_PATH,
     DATA_DIR,
+    DATABASE_URL,
     MODEL_LITE,
     MODEL,
     FAILING_THRESHOLD,
@@ -19,6 +20,7 @@ __all__ = [
     "BASE_DIR",
     "LOG_PATH",
     "DATA_DIR",
+    "DATABASE_URL",
     "MODEL_LITE",
     "MODEL",
     "FAILING_THRESHOLD",
@@ -1,7 +1,10 @@
 """Configuration settings for the Smart Grading Assistant."""
 
-import os
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 from dotenv import load_dotenv
 from google.genai import types
 
@@ -17,6 +20,12 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Session database (any async SQLAlchemy URL, e.g. postgresql+asyncpg://...)
+DATABASE_URL = os.getenv(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(DATA_DIR, 'grading_sessions.db')}",
+)
+
 # Models
 MODEL_LITE = os.getenv("MODEL_LITE", "gemini-2.5-flash-lite")
 MODEL = os.getenv("MODEL", "gemini-2.5-flash")
@@ -30,21 +39,40 @@ FAILING_THRESHOLD = 50
 EXCEPTIONAL_THRESHOLD = 90
 
 # Retry configuration for LLM calls
+# Exponential backoff (0.5s, 1s, 2s, 4s) with jitter, each delay capped at 30s
+# Status codes are left to the google-genai default (408, 429, 500, 502, 503, 504)
 retry_config = types.HttpRetryOptions(
     attempts=5,
-    exp_base=7,
-    initial_delay=1,
+    exp_base=2,
+    initial_delay=0.5,
+    max_delay=30,
+    jitter=1.0,
 )
 
 # Configure logging
+# Records go through a queue and a background thread writes them to disk,
+# so logging calls never block the event loop on file I/O.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+_log_queue = queue.Queue(-1)
+_file_handler = logging.handlers.RotatingFileHandler(
+    LOG_PATH, maxBytes=10_000_000, backupCount=3
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Records are formatted by the QueueHandler before they are enqueued
 logging.basicConfig(
-    filename=LOG_PATH,
-    level=logging.DEBUG,
+    level=LOG_LEVEL,
     format="%(asctime)s - %(filename)s:%(lineno)s - %(levelname)s - %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
 
-print(f"✅ Configuration loaded")
-print(f"   LOG_PATH: {LOG_PATH}")
-print(f"   DATA_DIR: {DATA_DIR}")
-print(f"   MODEL: {MODEL}")
-print(f"   MODEL_LITE: {MODEL_LITE}")
+logger = logging.getLogger(__name__)
+logger.debug(
+    "Configuration loaded (LOG_PATH=%s, DATA_DIR=%s, MODEL=%s, MODEL_LITE=%s)",
+    LOG_PATH, DATA_DIR, MODEL, MODEL_LITE,
+)
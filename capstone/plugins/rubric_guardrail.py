@@ -9,6 +9,8 @@ from google.adk.agents.callback_context import CallbackContext
 from google.adk.plugins.base_plugin import BasePlugin
 from google.genai import types
 
+from ..utils import json_utils
+
 
 class RubricGuardrailPlugin(BasePlugin):
     """Guardrail to ensure rubric is valid before running grading agents.
@@ -20,10 +22,9 @@ class RubricGuardrailPlugin(BasePlugin):
     the agent's execution gracefully without crashing the app.
     """
 
-    def __init__(self, build_graders_fn=None) -> None:
+    def __init__(self) -> None:
         super().__init__(name="rubric_guardrail")
         self._blocked_agents: set = set()
-        self._build_graders_fn = build_graders_fn  # Injected dependency
 
     def _normalize_validation_payload(self, payload: Any) -> Optional[dict]:
         """Normalize different payload formats into a dict or None."""
@@ -31,7 +32,7 @@ class RubricGuardrailPlugin(BasePlugin):
             return payload
         if isinstance(payload, str):
             try:
-                parsed = json.loads(payload)
+                parsed = json_utils.loads(payload)
                 if isinstance(parsed, dict):
                     return parsed
             except (json.JSONDecodeError, TypeError):
@@ -53,20 +54,6 @@ class RubricGuardrailPlugin(BasePlugin):
         except Exception:
             return {}
 
-    def _get_rubric(self, callback_context: CallbackContext) -> Optional[dict]:
-        """Get the latest rubric dict from state or invocation context."""
-        state_dict = self._get_state_dict(callback_context)
-        rubric = state_dict.get("rubric")
-        if isinstance(rubric, dict):
-            return rubric
-        inv_ctx = getattr(callback_context, "_invocation_context", None)
-        if inv_ctx:
-            session_state = getattr(inv_ctx, "session_state", {}) or {}
-            rubric = session_state.get("rubric")
-            if isinstance(rubric, dict):
-                return rubric
-        return None
-
     def _get_validation_result(self, callback_context: CallbackContext) -> Optional[dict]:
         """Extract rubric validation status from session state."""
         state_sources = []
@@ -98,22 +85,6 @@ class RubricGuardrailPlugin(BasePlugin):
             return False
         return validation_result.get("status") == "valid"
 
-    def _ensure_dynamic_graders(self, agent: BaseAgent, callback_context: CallbackContext) -> None:
-        """Inject dynamic graders based on rubric criteria."""
-        if not self._build_graders_fn:
-            return
-        rubric = self._get_rubric(callback_context)
-        if not rubric:
-            return
-        dynamic_graders, grade_keys = self._build_graders_fn(rubric)
-        if not dynamic_graders:
-            return
-        agent.sub_agents = dynamic_graders
-        try:
-            callback_context.state["grader_output_keys"] = grade_keys
-        except Exception:
-            pass
-
     def _build_block_message(self, agent_name: str, callback_context: CallbackContext) -> str:
         """Build a user-friendly blocking message."""
         validation_result = self._get_validation_result(callback_context)
@@ -144,13 +115,9 @@ No grading was performed. The pipeline has been safely stopped.
     ) -> Optional[types.Content]:
         """Block grading agents when rubric is not valid."""
         protected_agents = {
-            "ParallelGraders",
+            "MultiCriterionGrader",
             "AggregatorAgent",
-            "ApprovalAgent",
             "FeedbackGeneratorAgent",
-            "Grader_Code_Quality",
-            "Grader_Functionality",
-            "Grader_Documentation",
         }
 
         if agent.name not in protected_agents:
@@ -160,8 +127,6 @@ No grading was performed. The pipeline has been safely stopped.
         print(f"[RubricGuardrail] before_agent_callback - agent={agent.name}, validation_result={validation_result}")
 
         if validation_result and validation_result.get("status") == "valid":
-            if agent.name == "ParallelGraders":
-                self._ensure_dynamic_graders(agent, callback_context)
             print(f"[RubricGuardrail] ALLOW agent '{agent.name}' (rubric valid)")
             return None
 
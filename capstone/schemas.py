@@ -0,0 +1,41 @@
+"""Structured output schemas for the Smart Grading Assistant."""
+
+from typing import Annotated, List, Union
+
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictInt, conlist
+
+# Upper bound on rubric criteria; larger rubrics are rejected during parsing
+MAX_CRITERIA = 200
+
+
+class CriterionGrade(BaseModel):
+    """Grade assigned to a single rubric criterion."""
+
+    criterion: str = Field(description="Exact name of the rubric criterion")
+    score: float = Field(description="Score awarded, from 0 to the criterion's max points")
+    justification: str = Field(description="Evaluation notes justifying the score")
+
+
+class RubricGrades(BaseModel):
+    """Grades for every criterion of a rubric, produced in a single LLM call."""
+
+    grades: List[CriterionGrade]
+
+
+class CriterionModel(BaseModel):
+    """A single rubric criterion as accepted by validate_rubric."""
+
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+    max_score: Annotated[Union[StrictInt, StrictFloat], Field(gt=0)]
+    description: str
+
+
+class RubricModel(BaseModel):
+    """Grading rubric structure as accepted by validate_rubric."""
+
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+    criteria: conlist(CriterionModel, min_length=1, max_length=MAX_CRITERIA)
@@ -0,0 +1,6 @@
+"""Shared service clients for the Smart Grading Assistant."""
+
+from .gemini_client import get_model
+from .session_service import create_session_service
+
+__all__ = ["get_model", "create_session_service"]
@@ -0,0 +1,17 @@
+"""Shared Gemini model instances.
+
+Every agent reuses the same Gemini instance (and therefore the same
+underlying HTTP client) instead of constructing its own.
+"""
+
+import functools
+
+from google.adk.models.google_llm import Gemini
+
+from ..config import MODEL_LITE, retry_config
+
+
+@functools.lru_cache(maxsize=4)
+def get_model(model_name: str = MODEL_LITE) -> Gemini:
+    """Return the shared Gemini model for `model_name`, configured with retry_config."""
+    return Gemini(model=model_name, retry_options=retry_config)
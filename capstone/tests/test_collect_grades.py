@@ -0,0 +1,264 @@
+"""Unit tests for collect_grades.
+
+These tests validate that collect_grades correctly reconciles all_grades with
+the validated rubric in a mock session state and produces grades compatible
+with compute_final_score.
+"""
+
+import json
+import os
+import sys
+
+# Add parent directory to path for imports (same pattern as other tests)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.scoring import collect_grades, compute_final_score
+
+
+class MockState:
+    """Minimal mock state object for testing tools."""
+
+    def __init__(self):
+        self._data = {}
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def to_dict(self):
+        return self._data.copy()
+
+
+def _build_sample_state() -> MockState:
+    """Create a state with a rubric and two graded criteria.
+
+    This mirrors a realistic session after MultiCriterionGrader has run.
+    """
+
+    state = MockState()
+    # Rubric with slugs, as produced by validate_rubric
+    state["rubric"] = {
+        "name": "Essay Evaluation Rubric",
+        "criteria": [
+            {
+                "name": "Clarity of Argument",
+                "max_score": 25,
+                "description": "How clear and coherent the argument is",
+                "slug": "clarity_of_argument",
+            },
+            {
+                "name": "Use of Evidence",
+                "max_score": 25,
+                "description": "Quality and relevance of supporting evidence",
+                "slug": "use_of_evidence",
+            },
+        ],
+    }
+    # Structured output saved by MultiCriterionGrader under its output_key
+    state["all_grades"] = {
+        "grades": [
+            {
+                "criterion": "Clarity of Argument",
+                "score": 22,
+                "justification": "Argument is generally clear, only minor issues.",
+            },
+            {
+                "criterion": "Use of Evidence",
+                "score": 18,
+                "justification": "Good evidence, but could include more diverse sources.",
+            },
+        ]
+    }
+
+    return state
+
+
+def test_collect_grades_happy_path():
+    """collect_grades should return every rubric criterion from all_grades."""
+    state = _build_sample_state()
+    result = collect_grades(state)
+
+    assert result["status"] == "ok"
+    grades = result["grades"]
+    assert isinstance(grades, list)
+    assert len(grades) == 2
+
+    # Check that both criteria are present with correct scores
+    by_criterion = {g["criterion"]: g for g in grades}
+    assert "Clarity of Argument" in by_criterion
+    assert "Use of Evidence" in by_criterion
+
+    clarity = by_criterion["Clarity of Argument"]
+    evidence = by_criterion["Use of Evidence"]
+
+    assert clarity["score"] == 22
+    assert clarity["max_score"] == 25
+    assert "clear" in clarity["justification"].lower()
+
+    assert evidence["score"] == 18
+    assert evidence["max_score"] == 25
+    assert "evidence" in evidence["justification"].lower()
+
+    # Sanity check: grades are accepted by compute_final_score
+    agg = compute_final_score(result["grades"])
+    assert agg["status"] == "success"
+    assert agg["total_score"] == 40
+    assert agg["max_possible"] == 50
+
+
+def test_collect_grades_accepts_json_string():
+    """all_grades saved as a JSON string should be parsed like the dict form."""
+    state = _build_sample_state()
+    state["all_grades"] = json.dumps(state["all_grades"])
+
+    result = collect_grades(state)
+
+    assert result["status"] == "ok"
+    names = {g["criterion"] for g in result["grades"]}
+    assert {"Clarity of Argument", "Use of Evidence"} == names
+
+
+def test_collect_grades_error_missing_all_grades():
+    """Missing all_grades in state should produce an error status."""
+    state = _build_sample_state()
+    del state._data["all_grades"]
+
+    result = collect_grades(state)
+
+    assert result["status"] == "error"
+    assert "all_grades" in result["error_message"]
+
+
+def test_collect_grades_error_missing_rubric():
+    """Grades cannot be reconciled without the validated rubric."""
+    state = _build_sample_state()
+    del state._data["rubric"]
+
+    result = collect_grades(state)
+
+    assert result["status"] == "error"
+    assert "rubric" in result["error_message"].lower()
+
+
+def test_collect_grades_max_score_comes_from_rubric():
+    """The model's max_score is ignored in favour of the rubric's."""
+    state = _build_sample_state()
+    for grade in state["all_grades"]["grades"]:
+        grade["max_score"] = 10
+
+    result = collect_grades(state)
+
+    assert result["status"] == "ok"
+    grades = result["grades"]
+    assert [g["max_score"] for g in grades] == [25, 25]
+
+
+def test_collect_grades_matches_criteria_by_slug():
+    """A grade labelled with the criterion slug is matched to the rubric name."""
+    state = _build_sample_state()
+    state["all_grades"]["grades"][1]["criterion"] = "use_of_evidence"
+
+    result = collect_grades(state)
+
+    assert result["status"] == "ok"
+    names = [g["criterion"] for g in result["grades"]]
+    assert names == ["Clarity of Argument", "Use of Evidence"]
+
+
+def test_collect_grades_error_missing_criterion():
+    """A rubric criterion without a grade should produce an error status."""
+    state = _build_sample_state()
+    state["all_grades"]["grades"].pop()
+
+    result = collect_grades(state)
+
+    assert result["status"] == "error"
+    assert "Missing grade for criterion 'Use of Evidence'" in result["error_message"]
+
+
+def test_collect_grades_error_unknown_criterion():
+    """A grade for a criterion that is not in the rubric should be rejected."""
+    state = _build_sample_state()
+    state["all_grades"]["grades"][1]["criterion"] = "Originality"
+
+    result = collect_grades(state)
+
+    assert result["status"] == "error"
+    assert "unknown criterion 'Originality'" in result["error_message"]
+
+
+def test_collect_grades_error_duplicate_criterion():
+    """Grading the same criterion twice should be rejected, not double counted."""
+    state = _build_sample_state()
+    grades = state["all_grades"]["grades"]
+    grades[1] = dict(grades[0])
+
+    result = collect_grades(state)
+
+    assert result["status"] == "error"
+    assert "Duplicate grade for criterion 'Clarity of Argument'" in result["error_message"]
+
+
+def run_all_tests():
+    """Run all collect_grades tests and print summary."""
+    print("\n" + "=" * 70)
+    print("📊 COLLECT_GRADES - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Happy path from all_grades", test_collect_grades_happy_path),
+        ("all_grades as JSON string", test_collect_grades_accepts_json_string),
+        ("Error when all_grades is missing", test_collect_grades_error_missing_all_grades),
+        ("Error when rubric is missing", test_collect_grades_error_missing_rubric),
+        ("max_score comes from rubric", test_collect_grades_max_score_comes_from_rubric),
+        ("Criteria matched by slug", test_collect_grades_matches_criteria_by_slug),
+        ("Error when a criterion is missing", test_collect_grades_error_missing_criterion),
+        ("Error on unknown criterion", test_collect_grades_error_unknown_criterion),
+        ("Error on duplicate criterion", test_collect_grades_error_duplicate_criterion),
+    ]
+
+    passed = 0
+    failed = 0
+    errors = []
+
+    for name, test_fn in tests:
+        print("\n" + "-" * 70)
+        print(f"🧪 TEST: {name}")
+        print("-" * 70)
+        try:
+            if test_fn() is None or test_fn():
+                passed += 1
+        except AssertionError as e:
+            failed += 1
+            errors.append((name, f"AssertionError: {e}"))
+            print(f"   ❌ FAIL: {e}")
+        except Exception as e:
+            failed += 1
+            errors.append((name, f"{type(e).__name__}: {e}"))
+            print(f"   ❌ ERROR: {type(e).__name__}: {e}")
+
+    print("\n" + "=" * 70)
+    print("📊 TEST SUMMARY - collect_grades")
+    print("=" * 70)
+    print(f"   Total tests: {len(tests)}")
+    print(f"   ✅ Passed: {passed}")
+    print(f"   ❌ Failed: {failed}")
+
+    if errors:
+        print("\n   Failures:")
+        for name, error in errors:
+            print(f"     - {name}: {error}")
+
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
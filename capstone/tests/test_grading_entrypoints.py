@@ -0,0 +1,173 @@
+"""Unit tests for the grading entry points in agent.py.
+
+These tests validate grade_batch ordering and concurrency, session reuse in
+_get_or_create_session, and cleanup of transient sessions. A stub runner
+stands in for the pipeline, so no API calls are made.
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# agent.py uses package-relative imports, so put the directory containing
+# capstone/ on the path and import through the package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from capstone import agent as grading
+from capstone.config import APP_NAME, USER_ID
+
+
+class StubRunner:
+    """Runner stand-in that replies with one text event per run."""
+
+    def __init__(self, session_service):
+        self.session_service = session_service
+        self.session_ids = []
+
+    async def run_async(self, *, user_id, session_id, new_message):
+        self.session_ids.append(session_id)
+        # The session must still exist while the run is in progress
+        session = await self.session_service.get_session(
+            app_name=APP_NAME, user_id=user_id, session_id=session_id
+        )
+        assert session is not None
+        yield SimpleNamespace(
+            author="FeedbackGeneratorAgent",
+            content=types.Content(role="model", parts=[types.Part(text="Grade: B")]),
+        )
+
+
+def test_grade_batch_preserves_order_and_limits_concurrency():
+    """Results follow input order and at most max_concurrency gradings overlap."""
+    running = 0
+    peak = 0
+
+    async def fake_grade_submission(submission, rubric, persistent=True):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # Later submissions finish first, so ordering comes from gather
+        await asyncio.sleep(0.01 * (10 - int(submission)))
+        running -= 1
+        return {"results": [submission]}
+
+    original = grading.grade_submission
+    grading.grade_submission = fake_grade_submission
+    try:
+        submissions = [str(i) for i in range(10)]
+        results = asyncio.run(grading.grade_batch(submissions, {}, max_concurrency=3))
+    finally:
+        grading.grade_submission = original
+
+    assert [r["results"][0] for r in results] == submissions
+    assert peak <= 3, f"Expected at most 3 concurrent gradings, got {peak}"
+    assert peak == 3
+
+
+def test_get_or_create_session_reuses_existing_session():
+    """An existing session_id is fetched instead of being created again."""
+    service = InMemorySessionService()
+
+    async def _run():
+        first = await grading._get_or_create_session(service, "session-1")
+        second = await grading._get_or_create_session(service, "session-1")
+        listed = await service.list_sessions(app_name=APP_NAME, user_id=USER_ID)
+        return first, second, listed
+
+    first, second, listed = asyncio.run(_run())
+
+    assert first.id == second.id == "session-1"
+    assert len(listed.sessions) == 1
+
+
+def test_get_or_create_session_creates_when_missing():
+    """No session_id, or an unknown one, creates a new session."""
+    service = InMemorySessionService()
+
+    async def _run():
+        generated = await grading._get_or_create_session(service, None)
+        named = await grading._get_or_create_session(service, "unknown")
+        return generated, named
+
+    generated, named = asyncio.run(_run())
+
+    assert generated.id
+    assert named.id == "unknown"
+
+
+def test_transient_grading_deletes_its_session():
+    """persistent=False grades in memory and drops the session afterwards."""
+    service = InMemorySessionService()
+    runner = StubRunner(service)
+
+    originals = (grading.get_transient_session_service, grading.get_transient_runner)
+    grading.get_transient_session_service = lambda: service
+    grading.get_transient_runner = lambda: runner
+    try:
+        result = asyncio.run(grading.grade_submission("print('hi')", {}, persistent=False))
+        listed = asyncio.run(service.list_sessions(app_name=APP_NAME, user_id=USER_ID))
+    finally:
+        grading.get_transient_session_service, grading.get_transient_runner = originals
+
+    assert result == {"results": ["Grade: B"]}
+    assert len(runner.session_ids) == 1
+    assert listed.sessions == []
+
+
+def run_all_tests():
+    """Run all grading entry point tests and print summary."""
+    print("\n" + "=" * 70)
+    print("📊 GRADING ENTRY POINTS - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Batch order and concurrency", test_grade_batch_preserves_order_and_limits_concurrency),
+        ("Existing session is reused", test_get_or_create_session_reuses_existing_session),
+        ("Missing session is created", test_get_or_create_session_creates_when_missing),
+        ("Transient session is deleted", test_transient_grading_deletes_its_session),
+    ]
+
+    passed = 0
+    failed = 0
+    errors = []
+
+    for name, test_fn in tests:
+        print("\n" + "-" * 70)
+        print(f"🧪 TEST: {name}")
+        print("-" * 70)
+        try:
+            if test_fn() is None or test_fn():
+                passed += 1
+        except AssertionError as e:
+            failed += 1
+            errors.append((name, f"AssertionError: {e}"))
+            print(f"   ❌ FAIL: {e}")
+        except Exception as e:
+            failed += 1
+            errors.append((name, f"{type(e).__name__}: {e}"))
+            print(f"   ❌ ERROR: {type(e).__name__}: {e}")
+
+    print("\n" + "=" * 70)
+    print("📊 TEST SUMMARY - grading entry points")
+    print("=" * 70)
+    print(f"   Total tests: {len(tests)}")
+    print(f"   ✅ Passed: {passed}")
+    print(f"   ❌ Failed: {failed}")
+
+    if errors:
+        print("\n   Failures:")
+        for name, error in errors:
+            print(f"     - {name}: {error}")
+
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -13,7 +13,6 @@ Tests multiple scenarios:
 Each test prints clear markers showing when guardrail is invoked.
 """
 
-import asyncio
 import json
 import sys
 import os
@@ -21,7 +20,13 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from tools.validate_rubric import validate_rubric
+from schemas import MAX_CRITERIA
+from tools.validate_rubric import (
+    MAX_RUBRIC_CHARS,
+    VALIDATION_CACHE_SIZE,
+    _validation_cache,
+    validate_rubric,
+)
 
 
 # =============================================================================
@@ -84,25 +89,6 @@ VALID_RUBRIC = {
     ],
 }
 
-# Custom rubrics to verify truly dynamic behavior (different names/counts)
-CUSTOM_RUBRIC_4 = {
-    "name": "Essay Evaluation Rubric",
-    "criteria": [
-        {"name": "Clarity of Argument", "max_score": 25, "description": "How clear and coherent the argument is"},
-        {"name": "Use of Evidence", "max_score": 25, "description": "Quality and relevance of supporting evidence"},
-        {"name": "Organization", "max_score": 25, "description": "Logical structure and flow"},
-        {"name": "Writing Mechanics", "max_score": 25, "description": "Grammar, spelling, and style"},
-    ],
-}
-
-CUSTOM_RUBRIC_2 = {
-    "name": "Short Presentation Rubric",
-    "criteria": [
-        {"name": "Delivery", "max_score": 50, "description": "Confidence, pacing, and body language"},
-        {"name": "Content", "max_score": 50, "description": "Relevance and depth of content"},
-    ],
-}
-
 INVALID_NO_CRITERIA = {
     "name": "Bad Rubric - No Criteria",
     # Missing "criteria" field
@@ -127,6 +113,13 @@ INVALID_BAD_SCORE = {
     ],
 }
 
+INVALID_NON_NUMERIC_SCORE = {
+    "name": "Bad Rubric - Non-numeric Score",
+    "criteria": [
+        {"name": "Quality", "max_score": "thirty", "description": "Bad score type"},
+    ],
+}
+
 INVALID_JSON_STRING = "this is not valid JSON {"
 
 
@@ -158,6 +151,49 @@ def test_validate_rubric_valid():
     return True
 
 
+def test_validate_rubric_cached_results_are_isolated():
+    """Test: Repeated validation of the same rubric returns independent copies."""
+    print("\n" + "="*60)
+    print("🧪 TEST 1b: Cached Rubric Validation")
+    print("="*60)
+    
+    rubric_json = json.dumps(VALID_RUBRIC)
+    first_ctx = MockToolContext()
+    first = validate_rubric(rubric_json, first_ctx)
+    first_ctx.state["rubric"]["criteria"][0]["name"] = "Mutated"
+    first["status"] = "mutated"
+    
+    second_ctx = MockToolContext()
+    second = validate_rubric(rubric_json, second_ctx)
+    
+    print(f"   Result: {second}")
+    
+    assert second["status"] == "valid"
+    assert second_ctx.state["rubric"]["criteria"][0]["name"] == "Code Quality"
+    
+    print("   ✅ PASS: Cached validation results are not shared between calls")
+    return True
+
+
+def test_validate_rubric_cache_is_bounded_and_keyed_by_digest():
+    """Test: The validation cache holds digests, not rubric text, and stays bounded."""
+    print("\n" + "="*60)
+    print("🧪 TEST 1c: Bounded Rubric Validation Cache")
+    print("="*60)
+    
+    for i in range(VALIDATION_CACHE_SIZE + 5):
+        rubric = {**VALID_RUBRIC, "name": f"Rubric {i}"}
+        validate_rubric(json.dumps(rubric), MockToolContext())
+    
+    print(f"   Cache entries: {len(_validation_cache)} (max {VALIDATION_CACHE_SIZE})")
+    
+    assert len(_validation_cache) == VALIDATION_CACHE_SIZE
+    assert all(isinstance(key, bytes) and len(key) == 32 for key in _validation_cache)
+    
+    print("   ✅ PASS: Cache is bounded and keyed by SHA-256 digests")
+    return True
+
+
 def test_validate_rubric_no_criteria():
     """Test: Rubric without criteria field fails validation."""
     print("\n" + "="*60)
@@ -243,6 +279,26 @@ def test_validate_rubric_bad_score():
     return True
 
 
+def test_validate_rubric_non_numeric_score():
+    """Test: Rubric with non-numeric score fails with a single clear error."""
+    print("\n" + "="*60)
+    print("🧪 TEST 5b: Invalid Rubric - Non-numeric Score")
+    print("="*60)
+    
+    ctx = MockToolContext()
+    result = validate_rubric(json.dumps(INVALID_NON_NUMERIC_SCORE), ctx)
+    
+    print(f"   Input: {INVALID_NON_NUMERIC_SCORE}")
+    print(f"   Result: {result}")
+    
+    assert result["status"] == "invalid", f"Expected invalid, got {result['status']}"
+    assert result["errors"] == ["Criterion 1: 'max_score' must be a number"]
+    assert ctx.state["rubric_validation"]["status"] == "invalid"
+    
+    print("   ✅ PASS: Non-numeric score correctly rejected")
+    return True
+
+
 def test_validate_rubric_invalid_json():
     """Test: Invalid JSON string fails validation."""
     print("\n" + "="*60)
@@ -264,6 +320,51 @@ def test_validate_rubric_invalid_json():
     return True
 
 
+def test_validate_rubric_too_many_criteria():
+    """Test: Rubric above the criteria limit is rejected."""
+    print("\n" + "="*60)
+    print("🧪 TEST 6b: Invalid Rubric - Too Many Criteria")
+    print("="*60)
+    
+    rubric = {
+        "name": "Huge Rubric",
+        "criteria": [
+            {"name": f"C{i}", "max_score": 1, "description": "x"}
+            for i in range(MAX_CRITERIA + 1)
+        ],
+    }
+    ctx = MockToolContext()
+    result = validate_rubric(json.dumps(rubric), ctx)
+    
+    print(f"   Result: {result}")
+    
+    assert result["status"] == "invalid", f"Expected invalid, got {result['status']}"
+    assert result["errors"] == [f"Rubric has too many criteria (max {MAX_CRITERIA})"]
+    assert ctx.state["rubric_validation"]["status"] == "invalid"
+    
+    print("   ✅ PASS: Oversized criteria list correctly rejected")
+    return True
+
+
+def test_validate_rubric_payload_too_large():
+    """Test: Oversized rubric payload is rejected before parsing."""
+    print("\n" + "="*60)
+    print("🧪 TEST 6c: Invalid Rubric - Payload Too Large")
+    print("="*60)
+    
+    ctx = MockToolContext()
+    result = validate_rubric("x" * (MAX_RUBRIC_CHARS + 1), ctx)
+    
+    print(f"   Result: {result}")
+    
+    assert result["status"] == "invalid", f"Expected invalid, got {result['status']}"
+    assert "too large" in result["errors"][0]
+    assert ctx.state["rubric_validation"]["status"] == "invalid"
+    
+    print("   ✅ PASS: Oversized payload correctly rejected")
+    return True
+
+
 # =============================================================================
 # UNIT TESTS FOR RubricGuardrailPlugin
 # =============================================================================
@@ -285,7 +386,7 @@ def test_guardrail_allows_valid_rubric():
     })
     
     # Test with protected agent
-    agent = MockAgent("ParallelGraders")
+    agent = MockAgent("MultiCriterionGrader")
     
     print(f"   Agent: {agent.name}")
     print(f"   State: {ctx.state.to_dict()}")
@@ -305,168 +406,6 @@ def test_guardrail_allows_valid_rubric():
     return True
 
 
-def test_parallel_graders_dynamic_creation_from_rubric():
-    """Test: Guardrail injects dynamic graders into ParallelGraders from rubric."""
-    print("\n" + "="*60)
-    print("🧪 TEST 7b: Dynamic ParallelGraders from Valid Rubric")
-    print("="*60)
-
-    # Import here to avoid circular imports during module load
-    from agent import RubricGuardrailPlugin
-
-    plugin = RubricGuardrailPlugin()
-
-    # First, run validate_rubric to simulate normal pipeline behavior
-    tool_ctx = MockToolContext()
-    validate_result = validate_rubric(json.dumps(VALID_RUBRIC), tool_ctx)
-
-    print(f"   validate_rubric result: {validate_result}")
-    print(f"   Tool state after validation: {tool_ctx.state.to_dict()}")
-
-    assert validate_result["status"] == "valid"
-    assert "rubric" in tool_ctx.state._data
-
-    # Use the same state as callback_context for the guardrail
-    callback_ctx = MockCallbackContext(state_data=tool_ctx.state._data)
-
-    # ParallelGraders agent that should receive dynamic sub_agents
-    agent = MockAgent("ParallelGraders")
-
-    print(f"   Before callback - agent.name={agent.name}, has sub_agents? {hasattr(agent, 'sub_agents')}")
-
-    # Run the async before_agent_callback hook
-    async def _run_callback():
-        return await plugin.before_agent_callback(agent=agent, callback_context=callback_ctx)
-
-    result_content = asyncio.run(_run_callback())
-
-    # Guardrail should allow execution (return None) and inject dynamic graders
-    print(f"   before_agent_callback returned: {result_content}")
-    assert result_content is None
-
-    # Check that dynamic graders were created
-    assert hasattr(agent, "sub_agents"), "ParallelGraders should have dynamic sub_agents after guardrail"
-    dynamic_graders = agent.sub_agents
-    rubric = callback_ctx.state.get("rubric")
-    assert rubric is not None, "Rubric should be present in callback context state"
-
-    expected_criteria = rubric["criteria"]
-    print(f"   Dynamic graders created: {len(dynamic_graders)}")
-    print(f"   Rubric criteria count: {len(expected_criteria)}")
-
-    assert len(dynamic_graders) == len(expected_criteria)
-
-    # Slugs and grade keys should match rubric slugs
-    expected_slugs = [c["slug"] for c in expected_criteria]
-    expected_grade_keys = [f"grade_{s}" for s in expected_slugs]
-
-    grader_output_keys = callback_ctx.state.get("grader_output_keys")
-    print(f"   grader_output_keys: {grader_output_keys}")
-
-    assert grader_output_keys == expected_grade_keys
-
-    dynamic_names = [g.name for g in dynamic_graders]
-    print(f"   Dynamic grader names: {dynamic_names}")
-
-    for slug in expected_slugs:
-        expected_name = f"Grader_{slug}"
-        assert expected_name in dynamic_names, f"Expected dynamic grader '{expected_name}' to be created"
-
-    print("   ✅ PASS: ParallelGraders receives dynamic graders and keys from rubric")
-    return True
-
-
-def test_parallel_graders_respects_custom_rubrics():
-    """Test: ParallelGraders follows custom rubrics (non-default names/counts)."""
-    print("\n" + "="*60)
-    print("🧪 TEST 7c: ParallelGraders with Custom Rubrics (4 and 2 criteria)")
-    print("="*60)
-
-    from agent import RubricGuardrailPlugin
-
-    # We'll test two different rubrics: one with 4 criteria, another with 2
-    for rubric in (CUSTOM_RUBRIC_4, CUSTOM_RUBRIC_2):
-        print(f"\n   Testing rubric: {rubric['name']}")
-
-        plugin = RubricGuardrailPlugin()
-        tool_ctx = MockToolContext()
-
-        # Validate rubric and persist to state (adds slugs per criterion)
-        validate_result = validate_rubric(json.dumps(rubric), tool_ctx)
-        print(f"     validate_rubric result: {validate_result}")
-        print(f"     Tool state after validation: {tool_ctx.state.to_dict()}")
-
-        assert validate_result["status"] == "valid"
-        assert "rubric" in tool_ctx.state._data
-
-        # Use validated state as callback context
-        callback_ctx = MockCallbackContext(state_data=tool_ctx.state._data)
-        agent = MockAgent("ParallelGraders")
-
-        # Run guardrail callback to inject dynamic graders
-        async def _run_callback():
-            return await plugin.before_agent_callback(agent=agent, callback_context=callback_ctx)
-
-        result_content = asyncio.run(_run_callback())
-        print(f"     before_agent_callback returned: {result_content}")
-        assert result_content is None
-
-        # Confirm dynamic graders and keys
-        assert hasattr(agent, "sub_agents"), "ParallelGraders should have dynamic sub_agents after guardrail"
-        dynamic_graders = agent.sub_agents
-        rubric_state = callback_ctx.state.get("rubric")
-        assert rubric_state is not None
-
-        expected_criteria = rubric_state["criteria"]
-        print(f"     Dynamic graders created: {len(dynamic_graders)}")
-        print(f"     Rubric criteria count: {len(expected_criteria)}")
-        assert len(dynamic_graders) == len(expected_criteria)
-
-        expected_slugs = [c["slug"] for c in expected_criteria]
-        expected_grade_keys = [f"grade_{s}" for s in expected_slugs]
-        grader_output_keys = callback_ctx.state.get("grader_output_keys")
-
-        print(f"     grader_output_keys: {grader_output_keys}")
-        assert grader_output_keys == expected_grade_keys
-
-        dynamic_names = [g.name for g in dynamic_graders]
-        print(f"     Dynamic grader names: {dynamic_names}")
-
-        for slug in expected_slugs:
-            expected_name = f"Grader_{slug}"
-            assert expected_name in dynamic_names, f"Expected dynamic grader '{expected_name}' to be created for slug '{slug}'"
-
-        # Inspect prompts for each dynamic grader to ensure rubric data is injected
-        for grader, criterion in zip(dynamic_graders, expected_criteria):
-            crit_name = criterion["name"]
-            crit_desc = criterion["description"]
-            max_score = criterion["max_score"]
-
-            print("     --- Dynamic grader prompt inspection ---")
-            print(f"       Grader name: {grader.name}")
-            print(f"       Description: {grader.description}")
-            print(f"       Instruction (truncated): {grader.instruction[:200]}...")
-
-            # Description should reference the rubric criterion name
-            assert crit_name in grader.description, (
-                f"Grader description should contain criterion name '{crit_name}'"
-            )
-
-            # Instruction should include criterion name, description, and max_score
-            assert crit_name in grader.instruction, (
-                f"Grader instruction should contain criterion name '{crit_name}'"
-            )
-            assert crit_desc in grader.instruction, (
-                f"Grader instruction should contain criterion description '{crit_desc}'"
-            )
-            assert str(max_score) in grader.instruction, (
-                f"Grader instruction should mention max_score '{max_score}'"
-            )
-
-    print("   ✅ PASS: ParallelGraders respects custom rubrics (names and counts)")
-    return True
-
-
 def test_guardrail_blocks_invalid_rubric():
     """Test: Guardrail blocks protected agents when rubric is invalid."""
     print("\n" + "="*60)
@@ -482,7 +421,7 @@ def test_guardrail_blocks_invalid_rubric():
         "rubric_validation": {"status": "invalid", "errors": ["Missing criteria"]}
     })
     
-    agent = MockAgent("ParallelGraders")
+    agent = MockAgent("MultiCriterionGrader")
     
     print(f"   Agent: {agent.name}")
     print(f"   State: {ctx.state.to_dict()}")
@@ -521,7 +460,7 @@ def test_guardrail_blocks_missing_validation():
     # Empty state - no rubric_validation key
     ctx = MockCallbackContext(state_data={})
     
-    agent = MockAgent("ParallelGraders")
+    agent = MockAgent("MultiCriterionGrader")
     
     print(f"   Agent: {agent.name}")
     print(f"   State: {ctx.state.to_dict()}")
@@ -557,16 +496,14 @@ def test_guardrail_ignores_unprotected_agents():
     
     # Test with unprotected agents
     unprotected = ["SmartGradingAssistant", "RubricValidatorAgent", "RandomAgent"]
-    protected = ["ParallelGraders", "AggregatorAgent", "Grader_Code_Quality"]
+    protected = ["MultiCriterionGrader", "AggregatorAgent", "FeedbackGeneratorAgent"]
     
     print(f"   Testing unprotected agents (should NOT be checked):")
     for name in unprotected:
         agent = MockAgent(name)
         # The plugin checks agent name first, before checking validation
         is_protected = name in {
-            "ParallelGraders", "AggregatorAgent", "ApprovalAgent",
-            "FeedbackGeneratorAgent", "Grader_Code_Quality",
-            "Grader_Functionality", "Grader_Documentation"
+            "MultiCriterionGrader", "AggregatorAgent", "FeedbackGeneratorAgent"
         }
         print(f"     - {name}: protected={is_protected}")
         assert not is_protected, f"{name} should not be protected"
@@ -575,9 +512,7 @@ def test_guardrail_ignores_unprotected_agents():
     for name in protected:
         agent = MockAgent(name)
         is_protected = name in {
-            "ParallelGraders", "AggregatorAgent", "ApprovalAgent",
-            "FeedbackGeneratorAgent", "Grader_Code_Quality",
-            "Grader_Functionality", "Grader_Documentation"
+            "MultiCriterionGrader", "AggregatorAgent", "FeedbackGeneratorAgent"
         }
         print(f"     - {name}: protected={is_protected}")
         assert is_protected, f"{name} should be protected"
@@ -638,15 +573,18 @@ def run_all_tests():
     tests = [
         # Validation tool tests
         ("Validate valid rubric", test_validate_rubric_valid),
+        ("Cached rubric validation", test_validate_rubric_cached_results_are_isolated),
+        ("Bounded rubric validation cache", test_validate_rubric_cache_is_bounded_and_keyed_by_digest),
         ("Validate rubric without criteria", test_validate_rubric_no_criteria),
         ("Validate rubric with empty criteria", test_validate_rubric_empty_criteria),
         ("Validate rubric with incomplete criterion", test_validate_rubric_incomplete_criterion),
         ("Validate rubric with negative score", test_validate_rubric_bad_score),
+        ("Validate rubric with non-numeric score", test_validate_rubric_non_numeric_score),
         ("Validate invalid JSON", test_validate_rubric_invalid_json),
+        ("Validate rubric with too many criteria", test_validate_rubric_too_many_criteria),
+        ("Validate oversized rubric payload", test_validate_rubric_payload_too_large),
         # Guardrail plugin tests
         ("Guardrail allows valid rubric", test_guardrail_allows_valid_rubric),
-        ("Dynamic ParallelGraders from rubric", test_parallel_graders_dynamic_creation_from_rubric),
-        ("ParallelGraders respects custom rubrics", test_parallel_graders_respects_custom_rubrics),
         ("Guardrail blocks invalid rubric", test_guardrail_blocks_invalid_rubric),
         ("Guardrail blocks missing validation", test_guardrail_blocks_missing_validation),
         ("Guardrail ignores unprotected agents", test_guardrail_ignores_unprotected_agents),
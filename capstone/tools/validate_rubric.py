@@ -10,12 +10,29 @@ The tool saves the validation result directly to session state so the
 RubricGuardrailPlugin can check it before allowing grading agents to run.
 """
 
-import json
+import copy
+import hashlib
 import re
 import unicodedata
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 from google.adk.tools.tool_context import ToolContext
+from pydantic import ValidationError
+
+try:
+    # When imported as part of the capstone package
+    from ..schemas import MAX_CRITERIA, RubricModel
+except ImportError:  # When running this module directly inside capstone/
+    from schemas import MAX_CRITERIA, RubricModel
+
+# Payloads longer than this many characters are rejected before parsing
+MAX_RUBRIC_CHARS = 1_000_000
+
+# Validation results kept for reuse, keyed by the SHA-256 digest of the
+# rubric text so large payloads are not held in memory as cache keys
+VALIDATION_CACHE_SIZE = 128
+_validation_cache: "OrderedDict[bytes, Tuple[dict, Optional[dict]]]" = OrderedDict()
 
 
 def _slugify(text: str) -> str:
@@ -29,6 +46,95 @@ def _slugify(text: str) -> str:
     return slug or "criterion"
 
 
+def _format_error(error: Any) -> str:
+    """Convert a pydantic error entry into the rubric error message format."""
+    loc = error.get("loc", ())
+    error_type = error.get("type")
+
+    if not loc:
+        if error_type == "json_invalid":
+            return f"Invalid JSON format: {error.get('msg')}"
+        return "Rubric must be a JSON object"
+
+    if loc[0] == "criteria" and len(loc) == 1:
+        if error_type == "missing":
+            return "Missing 'criteria' field in rubric"
+        if error_type == "too_short":
+            return "Rubric must have at least one criterion"
+        if error_type == "too_long":
+            return f"Rubric has too many criteria (max {MAX_CRITERIA})"
+        return "'criteria' must be a list"
+
+    if loc[0] == "criteria":
+        prefix = f"Criterion {loc[1] + 1}"
+        if len(loc) == 2:
+            return f"{prefix}: must be an object"
+        field = loc[2]
+        if error_type == "missing":
+            return f"{prefix}: missing '{field}' field"
+        if field == "max_score":
+            if error_type == "greater_than":
+                return f"{prefix}: 'max_score' must be positive"
+            return f"{prefix}: 'max_score' must be a number"
+        return f"{prefix}: '{field}' is invalid ({error.get('msg')})"
+
+    if error_type == "missing":
+        return f"Missing '{loc[0]}' field in rubric"
+    return f"'{loc[0]}' is invalid ({error.get('msg')})"
+
+
+def _validate_rubric_json(rubric_json: str) -> Tuple[dict, Optional[dict]]:
+    """Validate rubric_json and return (validation result, parsed rubric or None)."""
+    # Parse and validate the whole structure in a single pydantic call
+    try:
+        model = RubricModel.model_validate_json(rubric_json)
+    except ValidationError as e:
+        # Union types report one error per alternative; keep each message once
+        errors = list(dict.fromkeys(_format_error(err) for err in e.errors()))
+        return {
+            "status": "invalid",
+            "errors": errors
+        }, None
+    
+    rubric = model.model_dump()
+    total_points = sum(c.max_score for c in model.criteria)
+    
+    # Persist slug for downstream agents/tools
+    used_slugs = set()
+    for criterion in rubric["criteria"]:
+        slug = _slugify(criterion.get("name"))
+        original_slug = slug
+        counter = 2
+        while slug in used_slugs:
+            slug = f"{original_slug}_{counter}"
+            counter += 1
+        criterion["slug"] = slug
+        used_slugs.add(slug)
+    
+    return {
+        "status": "valid",
+        "criteria_count": len(rubric["criteria"]),
+        "total_points": total_points,
+        "message": f"Rubric '{rubric['name']}' is valid with {len(rubric['criteria'])} criteria totaling {total_points} points"
+    }, rubric
+
+
+def _cached_validate_rubric_json(rubric_json: str) -> Tuple[dict, Optional[dict]]:
+    """Return _validate_rubric_json results from an LRU cache keyed by digest.
+    
+    Cached results are shared; callers must copy them before handing them out.
+    """
+    key = hashlib.sha256(rubric_json.encode("utf-8", "surrogatepass")).digest()
+    cached = _validation_cache.get(key)
+    if cached is not None:
+        _validation_cache.move_to_end(key)
+        return cached
+    cached = _validation_cache[key] = _validate_rubric_json(rubric_json)
+    if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+        _validation_cache.popitem(last=False)
+    return cached
+
+
 def validate_rubric(rubric_json: str, tool_context: ToolContext) -> dict:
     """Validates a grading rubric structure and returns validation result.
     
@@ -59,84 +165,18 @@ def validate_rubric(rubric_json: str, tool_context: ToolContext) -> dict:
         tool_context.state["rubric_validation"] = result
         return result
     
-    errors = []
-    
-    # Parse JSON
-    try:
-        rubric = json.loads(rubric_json)
-    except json.JSONDecodeError as e:
+    # Reject oversized payloads before spending time parsing them
+    if len(rubric_json) > MAX_RUBRIC_CHARS:
         return _save_and_return({
             "status": "invalid",
-            "errors": [f"Invalid JSON format: {str(e)}"]
+            "errors": [f"Rubric payload too large (max {MAX_RUBRIC_CHARS} characters)"]
         })
     
-    # Check required top-level fields
-    if "name" not in rubric:
-        errors.append("Missing 'name' field in rubric")
-    
-    if "criteria" not in rubric:
-        errors.append("Missing 'criteria' field in rubric")
-        return _save_and_return({"status": "invalid", "errors": errors})
+    # Teachers reuse the same rubric across submissions; validation is cached
+    result, rubric = _cached_validate_rubric_json(rubric_json)
     
-    # Check criteria is a list
-    if not isinstance(rubric["criteria"], list):
-        errors.append("'criteria' must be a list")
-        return _save_and_return({"status": "invalid", "errors": errors})
+    if rubric is not None:
+        # Persist the parsed rubric so downstream agents can inspect the criteria
+        tool_context.state["rubric"] = copy.deepcopy(rubric)
     
-    # Check we have at least one criterion
-    if len(rubric["criteria"]) == 0:
-        errors.append("Rubric must have at least one criterion")
-        return _save_and_return({"status": "invalid", "errors": errors})
-    
-    # Validate each criterion
-    total_points = 0
-    used_slugs = set()
-    for i, criterion in enumerate(rubric["criteria"]):
-        prefix = f"Criterion {i + 1}"
-        
-        if not isinstance(criterion, dict):
-            errors.append(f"{prefix}: must be an object")
-            continue
-        
-        # Required fields for each criterion
-        if "name" not in criterion:
-            errors.append(f"{prefix}: missing 'name' field")
-        
-        if "max_score" not in criterion:
-            errors.append(f"{prefix}: missing 'max_score' field")
-        elif not isinstance(criterion["max_score"], (int, float)):
-            errors.append(f"{prefix}: 'max_score' must be a number")
-        elif criterion["max_score"] <= 0:
-            errors.append(f"{prefix}: 'max_score' must be positive")
-        else:
-            total_points += criterion["max_score"]
-        
-        if "description" not in criterion:
-            errors.append(f"{prefix}: missing 'description' field")
-
-        # Persist slug for downstream agents/tools
-        slug = _slugify(criterion.get("name"))
-        original_slug = slug
-        counter = 2
-        while slug in used_slugs:
-            slug = f"{original_slug}_{counter}"
-            counter += 1
-        criterion["slug"] = slug
-        used_slugs.add(slug)
-    
-    # Build and return result (saves to state via helper)
-    if errors:
-        return _save_and_return({
-            "status": "invalid",
-            "errors": errors
-        })
-    
-    # Persist the parsed rubric so downstream agents can inspect the criteria
-    tool_context.state["rubric"] = rubric
-    
-    return _save_and_return({
-        "status": "valid",
-        "criteria_count": len(rubric["criteria"]),
-        "total_points": total_points,
-        "message": f"Rubric '{rubric['name']}' is valid with {len(rubric['criteria'])} criteria totaling {total_points} points"
-    })
+    return _save_and_return(copy.deepcopy(result))
@@ -0,0 +1,213 @@
+"""Deterministic grade reconciliation and scoring used by AggregatorAgent.
+
+These are plain helpers, not agent tools: aggregate_grades calls them from
+its before_agent_callback, so aggregation never costs an LLM call.
+"""
+
+import json
+from typing import Any, Dict, List
+
+from . import json_utils
+from .text_utils import slugify
+
+# Letter grade per 10-point band: 0-59 F, 60s D, 70s C, 80s B, 90-100 A
+_LETTER_GRADES = "FFFFFFDCBAA"
+
+
+def _grades_from_all_grades(all_grades: Any) -> List[Dict[str, Any]]:
+    """Extract grades from the structured output of MultiCriterionGrader."""
+    if isinstance(all_grades, str):
+        try:
+            all_grades = json_utils.loads(all_grades)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(all_grades, dict):
+        return []
+    grades = all_grades.get("grades")
+    if not isinstance(grades, list):
+        return []
+    return [g for g in grades if isinstance(g, dict)]
+
+
+def _rubric_criteria(state: Any) -> List[Dict[str, Any]]:
+    """Return the criteria of the validated rubric stored in state."""
+    try:
+        rubric = state.get("rubric")
+    except Exception:
+        rubric = None
+    if not isinstance(rubric, dict):
+        return []
+    criteria = rubric.get("criteria")
+    if not isinstance(criteria, list):
+        return []
+    return [c for c in criteria if isinstance(c, dict)]
+
+
+def collect_grades(state: Any) -> Dict[str, Any]:
+    """Collect criterion grades from session state as a list of dicts.
+
+    Reads:
+    - all_grades: structured output of MultiCriterionGrader with one grade
+      per criterion.
+    - rubric: persisted by validate_rubric tool (with per-criterion slugs).
+
+    Every grade is matched to a rubric criterion by name or slug, and
+    max_score always comes from the rubric rather than from the model.
+    Missing, unknown or duplicate criteria are reported as errors.
+
+    Returns:
+        dict with:
+        - status: "ok" or "error"
+        - grades: list of {criterion, score, max_score, justification}
+          dicts, when status == "ok".
+        - error_message: description when status == "error".
+    """
+    criteria = _rubric_criteria(state)
+    if not criteria:
+        return {
+            "status": "error",
+            "error_message": "Validated rubric with criteria is missing from state.",
+        }
+
+    try:
+        raw_grades = _grades_from_all_grades(state.get("all_grades"))
+    except Exception:
+        raw_grades = []
+    if not raw_grades:
+        return {
+            "status": "error",
+            "error_message": "No valid grades found in all_grades.",
+        }
+
+    # Look criteria up by name (case-insensitive) or by slug
+    by_key: Dict[str, int] = {}
+    for index, c in enumerate(criteria):
+        name = str(c.get("name") or "")
+        by_key.setdefault(name.strip().casefold(), index)
+        by_key.setdefault(c.get("slug") or slugify(name), index)
+
+    graded: Dict[int, Dict[str, Any]] = {}
+    errors: List[str] = []
+
+    for grade in raw_grades:
+        label = str(grade.get("criterion") or "")
+        index = by_key.get(label.strip().casefold())
+        if index is None:
+            index = by_key.get(slugify(label))
+        if index is None:
+            errors.append(f"Grade for unknown criterion '{label}'")
+            continue
+
+        crit = criteria[index]
+        if index in graded:
+            errors.append(f"Duplicate grade for criterion '{crit.get('name')}'")
+            continue
+
+        try:
+            score = float(grade.get("score"))
+        except (TypeError, ValueError):
+            errors.append(f"Grade for '{crit.get('name')}' has a non-numeric score")
+            continue
+
+        graded[index] = {
+            "criterion": crit.get("name"),
+            "score": score,
+            "max_score": crit.get("max_score"),
+            "justification": grade.get("justification", ""),
+        }
+
+    for index, crit in enumerate(criteria):
+        if index not in graded:
+            errors.append(f"Missing grade for criterion '{crit.get('name')}'")
+
+    if errors:
+        return {
+            "status": "error",
+            "error_message": "; ".join(errors),
+        }
+
+    return {"status": "ok", "grades": [graded[i] for i in range(len(criteria))]}
+
+
+def compute_final_score(grades: List[dict]) -> dict:
+    """Aggregate a list of criterion grades into the final score result.
+    
+    Returns:
+        dict with status "success" plus total_score, max_possible,
+        percentage, letter_grade, grade_details, requires_human_approval,
+        approval_reason and message; or status "error" with error_message.
+    """
+    if not isinstance(grades, list) or len(grades) == 0:
+        return {
+            "status": "error",
+            "error_message": "'grades' must be a non-empty list"
+        }
+    
+    # Clamp scores into parallel lists, then total them in one pass each
+    scores = []
+    max_scores = []
+    grade_details = []
+    
+    for grade in grades:
+        score = grade.get("score")
+        max_score = grade.get("max_score")
+        if score is None or max_score is None:
+            return {
+                "status": "error",
+                "error_message": f"Each grade must have 'score' and 'max_score' fields"
+            }
+        
+        # Validate score is within bounds
+        if score < 0:
+            score = 0
+        if score > max_score:
+            score = max_score
+        
+        scores.append(score)
+        max_scores.append(max_score)
+        
+        grade_details.append({
+            "criterion": grade.get("criterion", "Unknown"),
+            "score": score,
+            "max_score": max_score,
+            "percentage": round((score / max_score) * 100, 1) if max_score > 0 else 0
+        })
+    
+    total_score = sum(scores)
+    max_possible = sum(max_scores)
+    
+    # Calculate percentage
+    percentage = round((total_score / max_possible) * 100, 1) if max_possible > 0 else 0
+    
+    # Determine letter grade
+    letter_grade = _get_letter_grade(percentage)
+    
+    # Determine if human approval is needed
+    # Thresholds: score < 50% (failing) or score > 90% (exceptional)
+    requires_approval = False
+    approval_reason = None
+    
+    if percentage < 50:
+        requires_approval = True
+        approval_reason = f"Score {percentage}% is below passing threshold (50%). Please review before confirming."
+    elif percentage > 90:
+        requires_approval = True
+        approval_reason = f"Score {percentage}% is exceptional (>90%). Please verify the evaluation is accurate."
+    
+    return {
+        "status": "success",
+        "total_score": total_score,
+        "max_possible": max_possible,
+        "percentage": percentage,
+        "letter_grade": letter_grade,
+        "grade_details": grade_details,
+        "requires_human_approval": requires_approval,
+        "approval_reason": approval_reason,
+        "message": f"Final score: {total_score}/{max_possible} ({percentage}%) - Grade: {letter_grade}"
+    }
+
+
+def _get_letter_grade(percentage: float) -> str:
+    """Convert percentage to letter grade."""
+    decile = min(max(int(percentage // 10), 0), 10)
+    return _LETTER_GRADES[decile]
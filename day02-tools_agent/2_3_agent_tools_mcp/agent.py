@@ -1,7 +1,10 @@
 import asyncio
-import base64
+import binascii
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Tuple
 
 from google.genai import types
 
@@ -65,7 +68,15 @@ image_agent = LlmAgent(
 
 runner = InMemoryRunner(agent=image_agent)
 
-response = asyncio.run(runner.run_debug("Provide a sample tiny image", verbose=True))
+
+def _decode_and_write(output_dir: Path, index: int, data: str) -> Tuple[Path, bytes]:
+    """Decode one base64 image and save it as tool_image_<index>.png."""
+    img_bytes = binascii.a2b_base64(data)
+    file_path = output_dir / f"tool_image_{index}.png"
+    # Unbuffered: the whole image goes out in a single write call
+    with open(file_path, "wb", buffering=0) as f:
+        f.write(img_bytes)
+    return file_path, img_bytes
 
 
 def handle_image_content(response) -> None:
@@ -83,7 +94,8 @@ def handle_image_content(response) -> None:
     output_dir = Path("generated_images")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    image_count = 0
+    # Collect every image payload first so they can be decoded in parallel
+    images = []
 
     for event in response:
         if not (event.content and event.content.parts):
@@ -94,21 +106,25 @@ def handle_image_content(response) -> None:
                 continue
 
             for item in part.function_response.response.get("content", []):
-                if item.get("type") != "image":
-                    continue
+                if item.get("type") == "image":
+                    images.append(item["data"])
 
-                img_bytes = base64.b64decode(item["data"])
-                file_path = output_dir / f"tool_image_{image_count}.png"
-                file_path.write_bytes(img_bytes)
-                print(f"🖼️ Saved tool image to {file_path}")
+    if not images:
+        print("ℹ️ No image data was returned in the response.")
+        return
 
-                if can_display and display and IPImage:
-                    display(IPImage(data=img_bytes))
+    # Decoding and file writes release the GIL, so threads overlap them
+    with ThreadPoolExecutor(max_workers=min(8, len(images))) as executor:
+        saved = list(executor.map(partial(_decode_and_write, output_dir), range(len(images)), images))
 
-                image_count += 1
+    # IPython display must stay on the main thread
+    for file_path, img_bytes in saved:
+        print(f"🖼️ Saved tool image to {file_path}")
 
-    if image_count == 0:
-        print("ℹ️ No image data was returned in the response.")
+        if can_display and display and IPImage:
+            display(IPImage(data=img_bytes))
 
 
-handle_image_content(response)
+if __name__ == "__main__":
+    response = asyncio.run(runner.run_debug("Provide a sample tiny image", verbose=True))
+    handle_image_content(response)
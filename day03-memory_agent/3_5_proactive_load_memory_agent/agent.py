@@ -1,8 +1,9 @@
 import asyncio
+import functools
 from google.adk.agents import LlmAgent
 from google.adk.models.google_llm import Gemini
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from google.adk.sessions import InMemorySessionService, Session
 from google.adk.memory import InMemoryMemoryService
 from google.adk.tools import load_memory, preload_memory
 from google.genai import types
@@ -13,6 +14,24 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+async def _get_or_create_session(session_id: str) -> Session:
+    """Return the session for session_id, creating it only if it doesn't exist."""
+    session = await session_service.get_session(
+        app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+    )
+    if session is None:
+        session = await session_service.create_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        )
+    return session
+
+
+@functools.lru_cache(maxsize=256)
+def _user_content(text: str) -> types.Content:
+    """Build (and reuse) the user message for a query text."""
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
 async def run_session(
     runner_instance: Runner, user_queries: list[str] | str, session_id: str = "default"
 ):
@@ -20,14 +39,7 @@ async def run_session(
     print(f"\n### Session: {session_id}")
 
     # Create or retrieve session
-    try:
-        session = await session_service.create_session(
-            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
-        )
-    except:
-        session = await session_service.get_session(
-            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
-        )
+    session = await _get_or_create_session(session_id)
 
     # Convert single query to list
     if isinstance(user_queries, str):
@@ -36,7 +48,7 @@ async def run_session(
     # Process each query
     for query in user_queries:
         print(f"\nUser > {query}")
-        query_content = types.Content(role="user", parts=[types.Part(text=query)])
+        query_content = _user_content(query)
 
         # Stream agent response
         async for event in runner_instance.run_async(
@@ -105,10 +117,19 @@ async def run_demo():
 
     print("✅ Session added to memory!")
 
-    # Test retrieval in a NEW session
-    await run_session(
-    runner, "What is my favorite color?", "color-test"  # Different session ID
-)
+    # Test retrieval in a NEW session while searching memory directly.
+    # Both only read memory, so they can run concurrently.
+    color_result, search_response = await asyncio.gather(
+        run_session(
+            runner, "What is my favorite color?", "color-test"  # Different session ID
+        ),
+        memory_service.search_memory(
+            app_name=APP_NAME, user_id=USER_ID, query="What is the favorite color?"
+        ),
+        return_exceptions=True,
+    )
+    if isinstance(color_result, Exception):
+        print(f"⚠️ color-test session failed: {color_result}")
 
     # Let's see what's in the session
     print("📝 Session contains:")
@@ -120,11 +141,11 @@ async def run_demo():
         )
     print(f"  {event.content.role}: {text}...")
 
-    
-# Search for color preferences
-    search_response = await memory_service.search_memory(
-    app_name=APP_NAME, user_id=USER_ID, query="What is the favorite color?"
-    )
+
+    # Search for color preferences
+    if isinstance(search_response, Exception):
+        print(f"⚠️ Memory search failed: {search_response}")
+        return
 
     print("🔍 Search Results:")
     print(f"  Found {len(search_response.memories)} relevant memories")
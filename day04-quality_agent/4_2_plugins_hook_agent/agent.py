@@ -1,4 +1,6 @@
+import itertools
 import logging
+import logging.handlers
 import os
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.callback_context import CallbackContext
@@ -26,17 +28,25 @@ load_dotenv()
 
 
 # Clean up any previous logs
-for log_file in ["logger.log", "web.log", "tunnel.log"]:
-    if os.path.exists(log_file):
-        os.remove(log_file)
+for log_file in ("logger.log", "web.log", "tunnel.log"):
+    try:
+        os.unlink(log_file)
         print(f"🧹 Cleaned up {log_file}")
+    except FileNotFoundError:
+        pass
 
 # Configure logging with DEBUG log level.
-logging.basicConfig(
-    filename="logger.log",
-    level=logging.DEBUG,
-    format="%(filename)s:%(lineno)s %(levelname)s:%(message)s",
+# Records are buffered in memory and written in batches of 4096 (or right
+# away on ERROR); the rest is flushed when the process exits.
+file_handler = logging.FileHandler("logger.log", delay=True)
+file_handler.setFormatter(
+    logging.Formatter("%(filename)s:%(lineno)s %(levelname)s:%(message)s")
 )
+memory_handler = logging.handlers.MemoryHandler(
+    capacity=4096, flushLevel=logging.ERROR, target=file_handler
+)
+logging.getLogger().addHandler(memory_handler)
+logging.getLogger().setLevel(logging.DEBUG)
 
 print("✅ Logging configured")
 
@@ -57,22 +67,28 @@ class CountInvocationPlugin(BasePlugin):
         self.agent_count: int = 0
         self.tool_count: int = 0
         self.llm_request_count: int = 0
+        # next() hands each caller a distinct number, unlike a racy `+= 1`; the
+        # public counts are just the latest value handed out
+        self._agent_counter = itertools.count(1)
+        self._llm_request_counter = itertools.count(1)
 
     # Callback 1: Runs before an agent is called. You can add any custom logic here.
     async def before_agent_callback(
         self, *, agent: BaseAgent, callback_context: CallbackContext
     ) -> None:
         """Count agent runs."""
-        self.agent_count += 1
-        logging.info(f"[Plugin] Agent run count: {self.agent_count}")
+        n = next(self._agent_counter)
+        self.agent_count = n
+        logging.info(f"[Plugin] Agent run count: {n}")
 
     # Callback 2: Runs before a model is called. You can add any custom logic here.
     async def before_model_callback(
         self, *, callback_context: CallbackContext, llm_request: LlmRequest
     ) -> None:
         """Count LLM requests."""
-        self.llm_request_count += 1
-        logging.info(f"[Plugin] LLM request count: {self.llm_request_count}")
+        n = next(self._llm_request_counter)
+        self.llm_request_count = n
+        logging.info(f"[Plugin] LLM request count: {n}")
     
 
 def count_papers(papers: List[str]):
@@ -86,10 +102,13 @@ def count_papers(papers: List[str]):
     return len(papers)
 
 
+# One model instance (and HTTP client) shared by both agents
+gemini_model = Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config)
+
 # Google search agent
 google_search_agent = LlmAgent(
     name="google_search_agent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=gemini_model,
     description="Searches for information using Google search",
     instruction="Use the google_search tool to find information on the given topic. Return the raw search results.",
     tools=[google_search],
@@ -98,7 +117,7 @@ google_search_agent = LlmAgent(
 # Root agent
 research_agent_with_plugin = LlmAgent(
     name="research_paper_finder_agent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=gemini_model,
     instruction="""Your task is to find research papers and count them. 
    
    You must follow these steps:
@@ -123,5 +142,6 @@ runner = InMemoryRunner(
 
 print("✅ Runner configured")
 
-print("🚀 Running agent with LoggingPlugin...")
-print("📊 Watch the comprehensive logging output below:\n")
+if __name__ == "__main__":
+    print("🚀 Running agent with LoggingPlugin...")
+    print("📊 Watch the comprehensive logging output below:\n")